@@ -467,11 +467,8 @@ class CouplingElement(ShaftElement):
         z_lower = [zpos, zpos, zpos + L, zpos + L, zpos]
         y_lower = [ypos, ypos - scale, ypos - scale, ypos, ypos]
 
-        z_pos = z_upper
-        z_pos.extend(z_lower)
-
-        y_pos = y_upper
-        y_pos.extend(y_lower)
+        z_pos = z_upper + z_lower
+        y_pos = y_upper + y_lower
 
         name = (
             f"{self.tag}<br>(<i>CouplingElement</i>)"
@@ -360,20 +360,14 @@ class DiskElement(Element):
         zpos, ypos, scale_factor = position
         radius = scale_factor / 8
 
-        # coordinates to plot disks elements
-        z_upper = [zpos, zpos + scale_factor / 25, zpos - scale_factor / 25, zpos]
-        y_upper = [ypos, ypos + 2 * scale_factor, ypos + 2 * scale_factor, ypos]
-
-        z_lower = [zpos, zpos + scale_factor / 25, zpos - scale_factor / 25, zpos]
-        y_lower = [-ypos, -ypos - 2 * scale_factor, -ypos - 2 * scale_factor, -ypos]
-
-        z_pos = z_upper
-        z_pos.append(None)
-        z_pos.extend(z_lower)
-
-        y_pos = y_upper
-        y_upper.append(None)
-        y_pos.extend(y_lower)
+        # coordinates to plot disks elements (upper and lower patches split by nan)
+        dz = scale_factor / 25
+        dy = 2 * scale_factor
+        z_pos = np.array(
+            [zpos, zpos + dz, zpos - dz, zpos, np.nan, zpos, zpos + dz, zpos - dz, zpos]
+        )
+        y_upper = [ypos, ypos + dy, ypos + dy, ypos]
+        y_pos = np.array([*y_upper, np.nan, *(-y for y in y_upper)])
 
         customdata = [self.n, self.Ip, self.Id, self.m]
         hovertemplate = (
@@ -423,9 +417,9 @@ class DiskElement(Element):
                 xref="x",
                 yref="y",
                 x0=zpos - radius,
-                y0=y_lower[1] - radius,
+                y0=-y_upper[1] - radius,
                 x1=zpos + radius,
-                y1=y_lower[1] + radius,
+                y1=-y_upper[1] + radius,
                 fillcolor=self.color,
                 line_color=self.color,
             )
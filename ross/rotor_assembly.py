@@ -206,17 +206,14 @@ class Rotor(object):
         self.bearing_elements = sorted(bearing_elements, key=lambda el: el.n)
         self.disk_elements = disk_elements
         self.point_mass_elements = point_mass_elements
-        self.elements = [
-            el
-            for el in flatten(
-                [
-                    self.shaft_elements,
-                    self.disk_elements,
-                    self.bearing_elements,
-                    self.point_mass_elements,
-                ]
+        self.elements = list(
+            chain(
+                self.shaft_elements,
+                self.disk_elements,
+                self.bearing_elements,
+                self.point_mass_elements,
             )
-        ]
+        )
 
         # check if tags are unique
         tags_list = [el.tag for el in self.elements]
@@ -326,22 +323,16 @@ class Rotor(object):
         self.nodes_pos = nodes_pos
         self.nodes = list(range(len(self.nodes_pos)))
 
-        nodes_i_d = []
-        for n in self.nodes:
-            nodes_i_d.append(
-                self.df_shaft[
-                    (self.df_shaft.n_l == n) | (self.df_shaft.n_r == n)
-                ].i_d.min()
-            )
+        # diameters of all shaft elements touching each node (left or right)
+        nodes_d = pd.concat(
+            [
+                df_shaft[["n_l", "i_d", "o_d"]].rename(columns={"n_l": "node"}),
+                df_shaft[["n_r", "i_d", "o_d"]].rename(columns={"n_r": "node"}),
+            ]
+        ).groupby("node")
+        nodes_i_d = list(nodes_d["i_d"].min().reindex(self.nodes))
+        nodes_o_d = list(nodes_d["o_d"].max().reindex(self.nodes))
         self.nodes_i_d = nodes_i_d
-
-        nodes_o_d = []
-        for n in self.nodes:
-            nodes_o_d.append(
-                self.df_shaft[
-                    (self.df_shaft.n_l == n) | (self.df_shaft.n_r == n)
-                ].o_d.max()
-            )
         self.nodes_o_d = nodes_o_d
 
         shaft_elements_length = list(df_shaft.groupby("n_l")["L"].min())
@@ -651,12 +642,14 @@ class Rotor(object):
         target_elements = []
         new_elems_length = []
 
+        nodes_idx = {node: i for i, node in enumerate(self.nodes)}
+
         for new_pos in new_nodes_pos:
             for elm in shaft_elements:
                 elm.tag = None
 
-                pos_l = self.nodes_pos[self.nodes.index(elm.n_l)]
-                pos_r = self.nodes_pos[self.nodes.index(elm.n_r)]
+                pos_l = self.nodes_pos[nodes_idx[elm.n_l]]
+                pos_r = self.nodes_pos[nodes_idx[elm.n_r]]
 
                 if new_pos > pos_l and new_pos < pos_r:
                     target_elements.append(elm)
@@ -1054,14 +1047,15 @@ class Rotor(object):
 
             if synchronous:
                 if elm in self.shaft_elements:
-                    a0 = elm.dof_mapping()["alpha_0"]
-                    b0 = elm.dof_mapping()["beta_0"]
-                    x0 = elm.dof_mapping()["x_0"]
-                    y0 = elm.dof_mapping()["y_0"]
-                    x1 = elm.dof_mapping()["x_1"]
-                    y1 = elm.dof_mapping()["y_1"]
-                    a1 = elm.dof_mapping()["alpha_1"]
-                    b1 = elm.dof_mapping()["beta_1"]
+                    dof_mapping = elm.dof_mapping()
+                    a0 = dof_mapping["alpha_0"]
+                    b0 = dof_mapping["beta_0"]
+                    x0 = dof_mapping["x_0"]
+                    y0 = dof_mapping["y_0"]
+                    x1 = dof_mapping["x_1"]
+                    y1 = dof_mapping["y_1"]
+                    a1 = dof_mapping["alpha_1"]
+                    b1 = dof_mapping["beta_1"]
                     G = elm.G()
                     for i in range(2 * self.number_dof):
                         if i in (x0, b0, x1, b1):
@@ -1075,8 +1069,9 @@ class Rotor(object):
                             M[i, y1] = M[i, y1] + G[i, x1]
                             M[i, a1] = M[i, a1] - G[i, b1]
                 elif elm in self.disk_elements:
-                    a0 = elm.dof_mapping()["alpha_0"]
-                    b0 = elm.dof_mapping()["beta_0"]
+                    dof_mapping = elm.dof_mapping()
+                    a0 = dof_mapping["alpha_0"]
+                    b0 = dof_mapping["beta_0"]
                     G = elm.G()
                     M[a0, a0] = M[a0, a0] - G[a0, b0]
                     M[b0, b0] = M[b0, b0] + G[b0, a0]
@@ -1254,14 +1249,15 @@ class Rotor(object):
         if frequency is None:
             frequency = speed
 
-        Z = np.zeros((self.ndof, self.ndof))
-        I = np.eye(self.ndof)
+        ndof = self.ndof
+        A = np.zeros((2 * ndof, 2 * ndof))
+        np.fill_diagonal(A[:ndof, ndof:], 1.0)
 
-        # fmt: off
-        A = np.vstack(
-            [np.hstack([Z, I]),
-             np.hstack([la.solve(-self.M(frequency, synchronous=synchronous), self.K(frequency)), la.solve(-self.M(frequency,synchronous=synchronous), (self.C(frequency) + self.G() * speed))])])
-        # fmt: on
+        # assemble M only once and solve for K and C + G * speed together
+        M = self.M(frequency, synchronous=synchronous)
+        A[ndof:, :] = la.solve(
+            -M, np.hstack([self.K(frequency), self.C(frequency) + self.G() * speed])
+        )
 
         return A
 
@@ -2179,10 +2175,10 @@ class Rotor(object):
         """
 
         # Check if speed is array
-        try:
+        if np.ndim(speed) > 0:
             speed_is_array = len(set(speed)) > 1
             speed_ref = np.mean(speed)
-        except:
+        else:
             speed_is_array = False
             speed_ref = speed
 
@@ -2267,9 +2263,12 @@ class Rotor(object):
             C1 = get_array[0](kwargs.get("C", self.C(speed_ref)))
             K1 = get_array[0](kwargs.get("K", self.K(speed_ref)))
 
+            # speed is constant, so the damping matrix is combined once
+            C = C1 + C2 * speed_ref
+
             rotor_system = lambda step, **current_state: (
                 M,
-                C1 + C2 * speed_ref,
+                C,
                 K1,
                 forces(step, **current_state),
             )
@@ -2437,8 +2436,8 @@ class Rotor(object):
 
         # calculate scale factor if disks have scale_factor='mass'
         if self.disk_elements:
-            if all([disk.scale_factor == "mass" for disk in self.disk_elements]):
-                max_mass = max([disk.m for disk in self.disk_elements])
+            if all(disk.scale_factor == "mass" for disk in self.disk_elements):
+                max_mass = max(disk.m for disk in self.disk_elements)
                 for disk in self.disk_elements:
                     f = disk.m / max_mass
                     disk._scale_factor_calculated = (1 - f) * 0.5 + f * 1.0
@@ -1113,11 +1113,8 @@ class ShaftElement(Element):
             -self.idl / 2,
         ]
 
-        z_pos = z_upper
-        z_pos.extend(z_lower)
-
-        y_pos = y_upper
-        y_pos.extend(y_lower)
+        z_pos = z_upper + z_lower
+        y_pos = y_upper + y_lower
 
         if check_sld:
             customdata = [self.n, self.slenderness_ratio]